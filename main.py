@@ -9,23 +9,37 @@ Harry's Haunted House Slot Machine - Casino Edition (UI Upgraded)
 - Upgraded haunted-casino PyQt5 UI
 """
 
+import hashlib
 import os
+import struct
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from weakref import WeakValueDictionary
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QGridLayout, QVBoxLayout,
     QHBoxLayout, QComboBox, QMessageBox
 )
-from PyQt5.QtGui import QPixmap, QFont, QMovie
-from PyQt5.QtCore import Qt, QTimer, QUrl
+from PyQt5.QtGui import QPixmap, QFont, QMovie, QImage, QImageReader
+from PyQt5.QtCore import (
+    Qt, QTimer, QUrl, QObject, QRunnable,
+    QThreadPool, QEventLoop, QVariantAnimation, QAbstractAnimation, pyqtSignal
+)
 try:
     from PyQt5.QtMultimedia import QSoundEffect
     _HAS_SOUND = True
 except Exception as _e:
     print(f"[WARN] QtMultimedia not available for sounds: {_e}")
     _HAS_SOUND = False
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except Exception as _e:
+    print(f"[INFO] numba/numpy not available, using the pure-Python RNG: {_e}")
+    _HAS_NUMBA = False
 
 
 # ---------------------------------------------------------------------------
@@ -60,26 +74,68 @@ if not SOUNDS_DIR.exists():
 class SoundManager:
     def __init__(self):
         self.effects = {}
+        self._specs = {}
+        # (path, volume, loop) -> effect, so names sharing a WAV share one decode
+        self._by_spec = {}
         self.enabled = _HAS_SOUND
 
     def load(self, name: str, filename: str, volume: float = 0.6, loop: bool = False):
+        """Register a sound; the QSoundEffect itself is created on first play."""
         if not self.enabled:
             return
-        path = SOUNDS_DIR / filename
+        path = (SOUNDS_DIR / filename).resolve()
         if not path.exists():
             print(f"[MISS] Sound not found: {path} — add your .wav file or change the filename in code.")
             return
-        eff = QSoundEffect()
-        eff.setSource(QUrl.fromLocalFile(str(path)))
-        eff.setVolume(max(0.0, min(1.0, volume)))
-        if loop:
-            eff.setLoopCount(-2)  # infinite
-        self.effects[name] = eff
+        self._specs[name] = (path, volume, loop)
+
+    def _effect(self, name: str):
+        """Return the effect for `name`, creating it from its spec if needed."""
+        eff = self.effects.get(name)
+        if eff is None:
+            spec = self._specs.pop(name, None)
+            if spec is None:
+                return None
+            eff = self._by_spec.get(spec)
+            if eff is None:
+                path, volume, loop = spec
+                eff = QSoundEffect()
+                eff.setSource(QUrl.fromLocalFile(str(path)))
+                eff.setVolume(max(0.0, min(1.0, volume)))
+                if loop:
+                    eff.setLoopCount(-2)  # infinite
+                self._by_spec[spec] = eff
+            self.effects[name] = eff
+        return eff
+
+    def preload(self, names, timeout_ms: int = 500):
+        """
+        Create the effects for `names` now and wait (up to `timeout_ms`) for
+        them to finish loading, so their first play doesn't stall the UI.
+        """
+        if not self.enabled:
+            return
+        pending = [eff for eff in map(self._effect, names)
+                   if eff is not None and eff.status() == QSoundEffect.Status.Loading]
+        if not pending:
+            return
+        loop = QEventLoop()
+
+        def _check():
+            if all(eff.status() != QSoundEffect.Status.Loading for eff in pending):
+                loop.quit()
+
+        for eff in pending:
+            eff.statusChanged.connect(_check)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec_()
+        for eff in pending:
+            eff.statusChanged.disconnect(_check)
 
     def play(self, name: str):
         if not self.enabled:
             return
-        eff = self.effects.get(name)
+        eff = self._effect(name)
         if eff:
             eff.stop()
             eff.play()
@@ -87,7 +143,7 @@ class SoundManager:
     def start_loop(self, name: str):
         if not self.enabled:
             return
-        eff = self.effects.get(name)
+        eff = self._effect(name)
         if eff:
             eff.setLoopCount(-2)
             eff.play()
@@ -104,47 +160,148 @@ class SoundManager:
 # Casino-style RNG: Xoshiro256**
 # ---------------------------------------------------------------------------
 
+_MASK64 = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+
+if _HAS_NUMBA:
+    # Explicit signatures compile these at import, not inside the first
+    # spin on the UI thread
+    @njit("uint64(uint64, int64)", cache=True)
+    def _rotl64(x, k):
+        return (x << np.uint64(k)) | (x >> np.uint64(64 - k))
+
+    @njit("void(uint64[:], uint64[:])", cache=True)
+    def _xoshiro_fill(state, out):
+        """Write len(out) xoshiro256** outputs into `out`, advancing `state` in place."""
+        s0, s1, s2, s3 = state[0], state[1], state[2], state[3]
+        for i in range(out.shape[0]):
+            # uint64 arithmetic wraps on its own, so no masks are needed here
+            out[i] = _rotl64(s1 * np.uint64(5), 7) * np.uint64(9)
+            t = s1 << np.uint64(17)
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= t
+            s3 = _rotl64(s3, 45)
+        state[0], state[1], state[2], state[3] = s0, s1, s2, s3
+
+
 class Xoshiro256StarStar:
     """
     Simple Python implementation of the xoshiro256** PRNG.
     Good quality PRNG used in many simulations and games.
+
+    Outputs are generated BLOCK_SIZE at a time into a small buffer, so the
+    state update runs in one tight loop over locals instead of once per call.
+    When numba is installed the block is filled by a compiled uint64 kernel
+    (a larger block amortizes the call); the output sequence is identical.
     """
 
+    BLOCK_SIZE = 16
+    NUMBA_BLOCK_SIZE = 1024
+
+    # Jump polynomial: jump() is equivalent to 2**128 calls to next_uint64
+    JUMP = (0x180EC6D33CFD0ABA, 0xD5A61266F0C9392C, 0xA9582618E03FC9AA, 0x39ABDC4529B1661C)
+
     def __init__(self, seed_bytes: Optional[bytes] = None):
         if seed_bytes is None:
             seed_bytes = os.urandom(32)  # 256 bits
         if len(seed_bytes) < 32:
-            seed_bytes = (seed_bytes * (32 // len(seed_bytes) + 1))[:32]
-        self.s = [
-            int.from_bytes(seed_bytes[0:8], "little"),
-            int.from_bytes(seed_bytes[8:16], "little"),
-            int.from_bytes(seed_bytes[16:24], "little"),
-            int.from_bytes(seed_bytes[24:32], "little"),
-        ]
-        if not any(self.s):
+            seed_bytes = hashlib.sha256(seed_bytes).digest()
+        # Logged so a session can be replayed with from_hex()
+        self.seed_hex = seed_bytes[:32].hex()
+        print(f"[INFO] RNG seed: {self.seed_hex}")
+        # State words live in four plain attributes; nothing is rebuilt per draw
+        self.s0, self.s1, self.s2, self.s3 = struct.unpack("<4Q", seed_bytes[:32])
+        if not (self.s0 or self.s1 or self.s2 or self.s3):
             # avoid all-zero state
-            self.s[0] = 1
+            self.s0 = 1
+        self._buf = []
+        self._idx = 0
+
+    @classmethod
+    def from_hex(cls, seed_hex: str) -> "Xoshiro256StarStar":
+        """Recreate a generator from a logged `seed_hex`."""
+        return cls(bytes.fromhex(seed_hex))
+
+    def _fill(self):
+        """Refill the output buffer with the next block of values."""
+        if _HAS_NUMBA:
+            state = np.array((self.s0, self.s1, self.s2, self.s3), dtype=np.uint64)
+            out = np.empty(self.NUMBA_BLOCK_SIZE, dtype=np.uint64)
+            _xoshiro_fill(state, out)
+            self.s0, self.s1, self.s2, self.s3 = state.tolist()
+            # Python ints, so bounded()'s 128-bit multiply stays exact
+            self._buf = out.tolist()
+            self._idx = 0
+            return
 
-    @staticmethod
-    def _rotl(x: int, k: int) -> int:
-        return ((x << k) & ((1 << 64) - 1)) | (x >> (64 - k))
+        s0, s1, s2, s3 = self.s0, self.s1, self.s2, self.s3
+        buf = []
+        append = buf.append
+        for _ in range(self.BLOCK_SIZE):
+            # rotl(s1 * 5, 7) * 9, inlined: bits the shift pushes past 64
+            # only land above bit 64 after the * 9, so one final mask suffices
+            x = (s1 * 5) & _MASK64
+            append(((x << 7) | (x >> 57)) * 9 & _MASK64)
+
+            t = (s1 << 17) & _MASK64
+
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= t
+            s3 = ((s3 << 45) & _MASK64) | (s3 >> 19)  # rotl(s3, 45)
+
+        self.s0, self.s1, self.s2, self.s3 = s0, s1, s2, s3
+        self._buf = buf
+        self._idx = 0
+
+    def jump(self):
+        """
+        Advance the state by 2**128 outputs, discarding any buffered ones.
+        Successive jumps hand out non-overlapping streams for parallel use.
+        """
+        s0, s1, s2, s3 = self.s0, self.s1, self.s2, self.s3
+        j0 = j1 = j2 = j3 = 0
+        for word in self.JUMP:
+            for b in range(64):
+                if word >> b & 1:
+                    j0 ^= s0
+                    j1 ^= s1
+                    j2 ^= s2
+                    j3 ^= s3
+                t = (s1 << 17) & _MASK64
+                s2 ^= s0
+                s3 ^= s1
+                s1 ^= s2
+                s0 ^= s3
+                s2 ^= t
+                s3 = ((s3 << 45) & _MASK64) | (s3 >> 19)  # rotl(s3, 45)
+        self.s0, self.s1, self.s2, self.s3 = j0, j1, j2, j3
+        self._buf = []
+        self._idx = 0
 
     def next_uint64(self) -> int:
-        s0, s1, s2, s3 = self.s
-        result = self._rotl((s1 * 5) & ((1 << 64) - 1), 7) * 9 & ((1 << 64) - 1)
-
-        t = (s1 << 17) & ((1 << 64) - 1)
-
-        s2 ^= s0
-        s3 ^= s1
-        s1 ^= s2
-        s0 ^= s3
-        s2 ^= t
-        s3 = self._rotl(s3, 45)
-
-        self.s = [s0, s1, s2, s3]
+        if self._idx == len(self._buf):
+            self._fill()
+        result = self._buf[self._idx]
+        self._idx += 1
         return result
 
+    def next_block(self, count: int) -> list:
+        """Return the next `count` outputs in one call (same sequence as next_uint64)."""
+        out = self._buf[self._idx:self._idx + count]
+        self._idx += len(out)
+        while len(out) < count:
+            self._fill()
+            take = self._buf[:count - len(out)]
+            self._idx = len(take)
+            out.extend(take)
+        return out
+
     def random(self) -> float:
         """Return float in [0, 1)."""
         return (self.next_uint64() >> 11) * (1.0 / (1 << 53))
@@ -153,7 +310,25 @@ class Xoshiro256StarStar:
         """Return int in [0, n)."""
         if n <= 0:
             raise ValueError("n must be positive")
-        return self.next_uint64() % n
+        return self.bounded(self.next_uint64(), n)
+
+    def bounded(self, x: int, n: int) -> int:
+        """
+        Reduce a 64-bit draw `x` to [0, n) without modulo bias.
+
+        Lemire's multiply-high method: the high 64 bits of x * n are the
+        result. The low bits only need checking against the rejection
+        threshold when they are below n, which for reel-sized n almost
+        never happens, so the common path is one multiply and one shift.
+        """
+        m = x * n
+        low = m & _MASK64
+        if low < n:
+            threshold = (1 << 64) % n
+            while low < threshold:
+                m = self.next_uint64() * n
+                low = m & _MASK64
+        return m >> 64
 
 
 # ---------------------------------------------------------------------------
@@ -165,13 +340,21 @@ REELS = 5
 ROWS = 3
 
 # Symbols in use. Make sure you have matching PNGs in /images where possible.
-SYMBOLS = [
+# Names are interned so every grid cell refers to one shared string object.
+SYMBOLS = [sys.intern(s) for s in (
     "beetle", "spider", "bat", "ghost", "goblin",
     "skeleton", "mummy", "vampire", "witch", "werewolf",
     "haunted_house", "freespins"
-]
+)]
+
+SCATTER_SYMBOL = sys.intern("freespins")  # pays via feature, not line pays
 
-SCATTER_SYMBOL = "freespins"  # pays via feature, not line pays
+# Free spins awarded for 3, 4, 5+ scatters anywhere on the grid.
+SCATTER_AWARDS = {3: 10, 4: 12, 5: 15}
+
+# Inside the engine symbols are small integer IDs (their index in SYMBOLS).
+_SYMBOL_ID = {sym: i for i, sym in enumerate(SYMBOLS)}
+_SCATTER_ID = _SYMBOL_ID[SCATTER_SYMBOL]
 
 # Paytable: bet * multiplier for 3, 4, 5 of a kind.
 PAYTABLE = {
@@ -189,6 +372,14 @@ PAYTABLE = {
     # scatter handled via feature only
 }
 
+# PAYTABLE as a per-symbol-ID table indexed by run length (0..REELS), in
+# hundredths so line pays stay in integer math; unlisted run lengths and
+# the scatter row are 0
+_PAY_MULT_X100 = [
+    tuple(round(PAYTABLE.get(sym, {}).get(k, 0.0) * 100) for k in range(REELS + 1))
+    for sym in SYMBOLS
+]
+
 # 10 classic paylines: each list element is row index per reel [0, 1, 2]
 PAYLINES = [
     [1, 1, 1, 1, 1],  # middle
@@ -203,13 +394,32 @@ PAYLINES = [
     [1, 0, 1, 2, 1],
 ]
 
+# Paylines precomputed once: flat row-major grid indices and (row, reel) coords
+_PAYLINE_FLAT = [tuple(r * REELS + c for c, r in enumerate(line)) for line in PAYLINES]
+_PAYLINE_COORDS = [tuple((r, c) for c, r in enumerate(line)) for line in PAYLINES]
+# Scan records for _evaluate_lines: (payline_index, i0, i1, i2, i3, i4), one flat
+# tuple per line so the loop unpacks a single object per payline
+_PAYLINE_SCAN = tuple((k,) + idxs for k, idxs in enumerate(_PAYLINE_FLAT))
+
 BET_OPTIONS = [1, 2, 3, 5, 10, 20, 50, 100]
 START_BALANCE = 10_000
 
+# The engine keeps all money as integer cents and converts to dollars only
+# in the spin result.
+CENTS = 100
 
-def build_reel_strip(volatility: str = "MEDIUM") -> list:
+
+def format_cents(cents: int) -> str:
+    """Format integer cents as dollars with two decimals, e.g. 1205 -> '12.05'."""
+    dollars, frac = divmod(cents, CENTS)
+    return f"{dollars}.{frac:02d}"
+
+
+@lru_cache(maxsize=3)
+def build_reel_strip(volatility: str = "MEDIUM") -> tuple:
     """
     Build a single virtual reel strip for the given volatility profile.
+    Strips are immutable tuples, built once per profile and shared.
 
     LOW    = more low-pay symbols, fewer top symbols → gentle play
     MEDIUM = balanced
@@ -255,7 +465,7 @@ def build_reel_strip(volatility: str = "MEDIUM") -> list:
     strip = []
     for sym, n in counts.items():
         strip.extend([sym] * n)
-    return strip
+    return tuple(strip)
 
 
 # ---------------------------------------------------------------------------
@@ -263,8 +473,9 @@ def build_reel_strip(volatility: str = "MEDIUM") -> list:
 # ---------------------------------------------------------------------------
 
 class HauntedHouseSlot:
-    def __init__(self, volatility: str = "MEDIUM", rtp_mode: str = "STANDARD"):
-        self.balance = START_BALANCE
+    def __init__(self, volatility: str = "MEDIUM", rtp_mode: str = "STANDARD",
+                 seed_hex: Optional[str] = None):
+        self.balance_cents = START_BALANCE * CENTS
         self.reels = REELS
         self.rows = ROWS
         self.volatility = volatility.upper()
@@ -273,14 +484,14 @@ class HauntedHouseSlot:
         self.in_free_spins = False
 
         # Free-spin session tracking
-        self.free_spins_session_total = 0.0
+        self.free_spins_session_total_cents = 0
 
-        # Progressive jackpots
+        # Progressive jackpots (cents)
         self.jackpots = {
-            "mini":   {"base": 20.0,   "current": 20.0},
-            "minor":  {"base": 50.0,   "current": 50.0},
-            "jackpot": {"base": 500.0, "current": 500.0},
-            "grand":  {"base": 2500.0, "current": 2500.0},
+            "mini":   {"base_cents": 2_000,   "current_cents": 2_000},
+            "minor":  {"base_cents": 5_000,   "current_cents": 5_000},
+            "jackpot": {"base_cents": 50_000, "current_cents": 50_000},
+            "grand":  {"base_cents": 250_000, "current_cents": 250_000},
         }
         self._jackpot_base_probs = {
             "mini":   1.0 / 500.0,
@@ -288,13 +499,25 @@ class HauntedHouseSlot:
             "jackpot": 1.0 / 25000.0,
             "grand":  1.0 / 500000.0,
         }
+        # bet -> [(name, integer threshold on a 32-bit draw)], built up front
+        # for every bet option; any other bet is added on first use
+        self._jackpot_thresholds = {bet: self._jackpot_thresholds_for(bet) for bet in BET_OPTIONS}
 
-        # RNG
-        self.rng = Xoshiro256StarStar()
+        # RNG; pass a logged seed_hex to replay a session or simulation
+        self.rng = Xoshiro256StarStar.from_hex(seed_hex) if seed_hex else Xoshiro256StarStar()
 
-        # Build reel strips for each reel
+        # Every reel spins the same strip, so all reels share one list
         strip = build_reel_strip(self.volatility)
-        self.reel_strips = [strip[:] for _ in range(self.reels)]
+        self.reel_strip = strip
+        self.reel_strips = [strip] * self.reels
+        # The strip as bytes of symbol IDs, used by _generate_grid
+        self._strip_ids = bytes(_SYMBOL_ID[sym] for sym in strip)
+        # (top, middle, bottom) symbol IDs shown for each stop index, wrap
+        # already applied, so a reel's window is a single lookup
+        ids = self._strip_ids
+        self._stop_windows = tuple(zip(ids[-1:] + ids[:-1], ids, ids[1:] + ids[:1]))
+        # Reused by every _generate_grid call
+        self._flat_buf = bytearray(self.rows * self.reels)
 
         # RTP scaling factor (simple, linear)
         if self.rtp_mode == "LOOSE":
@@ -303,6 +526,12 @@ class HauntedHouseSlot:
             self.rtp_multiplier = 0.9
         else:
             self.rtp_multiplier = 1.0
+        self._rtp_pct = round(self.rtp_multiplier * 100)
+
+    @property
+    def balance(self) -> float:
+        """Current balance in dollars."""
+        return self.balance_cents / CENTS
 
     # ------------- Core spin cycle -------------
 
@@ -320,41 +549,41 @@ class HauntedHouseSlot:
         self.in_free_spins = using_free_spin
 
         if not using_free_spin:
-            if bet not in BET_OPTIONS or bet > self.balance:
+            if bet not in BET_OPTIONS or bet * CENTS > self.balance_cents:
                 return {"error": "Invalid bet or insufficient balance."}
-            self.balance -= bet
+            self.balance_cents -= bet * CENTS
 
-            inc = round(0.01 * bet, 2)
+            # 1% of the bet feeds every pot: one cent per dollar wagered
             for j in self.jackpots.values():
-                j["current"] = round(j["current"] + inc, 2)
+                j["current_cents"] += bet
 
-        grid, stop_indices = self._generate_grid()
+        grid, flat, stop_indices = self._generate_grid()
 
-        win_details, base_win = self._evaluate_lines(grid, bet, using_free_spin)
+        win_details, base_win_cents = self._evaluate_lines(flat, bet, using_free_spin)
 
-        freespins_cells, free_spins_awarded = self._evaluate_scatters(grid)
+        freespins_cells, free_spins_awarded = self._evaluate_scatters(flat)
 
-        jackpot_wins = self._roll_jackpots(bet)
-        jackpot_sum = round(sum(w["amount"] for w in jackpot_wins), 2)
+        jackpot_hits = self._roll_jackpots(bet)
+        jackpot_wins = [{"name": name, "amount": cents / CENTS} for name, cents in jackpot_hits]
 
-        total_win = round(base_win + jackpot_sum, 2)
-        self.balance = round(self.balance + total_win, 2)
+        total_win_cents = base_win_cents + sum(cents for _, cents in jackpot_hits)
+        self.balance_cents += total_win_cents
 
         free_spins_just_ended = False
-        free_spins_session_final = None
+        free_spins_session_final_cents = None
 
         if using_free_spin:
             self.free_spins -= 1
-            self.free_spins_session_total = round(self.free_spins_session_total + total_win, 2)
+            self.free_spins_session_total_cents += total_win_cents
             if self.free_spins == 0:
                 free_spins_just_ended = True
-                free_spins_session_final = round(self.free_spins_session_total, 2)
-                self.free_spins_session_total = 0.0
+                free_spins_session_final_cents = self.free_spins_session_total_cents
+                self.free_spins_session_total_cents = 0
 
         result = {
             "grid": grid,
             "bet": bet,
-            "win": total_win,
+            "win": total_win_cents / CENTS,
             "balance": self.balance,
             "win_details": win_details,
             "free_spins": self.free_spins,
@@ -362,9 +591,14 @@ class HauntedHouseSlot:
             "freespins_cells": freespins_cells if free_spins_awarded else [],
             "free_spins_awarded": free_spins_awarded,
             "jackpot_wins": jackpot_wins,
-            "jackpots": {k: round(v["current"], 2) for k, v in self.jackpots.items()},
-            "free_spins_session_total": round(self.free_spins_session_total, 2),
-            "free_spins_session_final": free_spins_session_final,
+            "jackpots": {k: v["current_cents"] / CENTS for k, v in self.jackpots.items()},
+            "free_spins_session_total": self.free_spins_session_total_cents / CENTS,
+            "free_spins_session_total_cents": self.free_spins_session_total_cents,
+            "free_spins_session_final": (
+                None if free_spins_session_final_cents is None
+                else free_spins_session_final_cents / CENTS
+            ),
+            "free_spins_session_final_cents": free_spins_session_final_cents,
             "free_spins_just_ended": free_spins_just_ended,
         }
 
@@ -374,92 +608,98 @@ class HauntedHouseSlot:
 
     def _generate_grid(self):
         """
-        From each reel strip, pick a random stop index and show 3 symbols:
+        For each reel, pick a random stop index on the strip and show 3 symbols:
         top = index-1, mid = index, bottom = index+1 (with wrap).
-        Returns (grid, stop_indices).
+        Returns (grid, flat, stop_indices): `grid` holds symbol names for the
+        result payload, `flat` the same cells as a row-major bytearray of
+        symbol IDs. `flat` is a buffer reused by the next call.
         """
-        grid = [[None for _ in range(self.reels)] for _ in range(self.rows)]
+        reels = self.reels
+        rows = self.rows
+        windows = self._stop_windows
+        n = len(windows)
+        bounded = self.rng.bounded
+        flat = self._flat_buf
         stop_indices = []
-        for reel_idx in range(self.reels):
-            strip = self.reel_strips[reel_idx]
-            n = len(strip)
-            stop = self.rng.randint(n)
+        raw_stops = self.rng.next_block(reels)
+        for reel_idx in range(reels):
+            stop = bounded(raw_stops[reel_idx], n)
             stop_indices.append(stop)
-            grid[0][reel_idx] = strip[(stop - 1) % n]
-            grid[1][reel_idx] = strip[stop]
-            grid[2][reel_idx] = strip[(stop + 1) % n]
-        return grid, stop_indices
+            top, mid, bottom = windows[stop]
+            flat[reel_idx] = top
+            flat[reels + reel_idx] = mid
+            flat[2 * reels + reel_idx] = bottom
+        symbols = SYMBOLS
+        grid = [[symbols[i] for i in flat[r * reels:(r + 1) * reels]] for r in range(rows)]
+        return grid, flat, stop_indices
 
     # ------------- Line evaluation -------------
 
-    def _evaluate_lines(self, grid, bet: int, using_free_spin: bool):
+    def _evaluate_lines(self, flat, bet: int, using_free_spin: bool):
         """
-        Evaluate all paylines for wins.
+        Evaluate all paylines for wins on the row-major `flat` grid of symbol IDs.
         Left-to-right, 3+ identical symbols (scatter does not pay lines).
+        Returns (win_details, total_cents).
         """
         win_details = []
-        total = 0.0
-
-        fs_multiplier = 2.0 if using_free_spin else 1.0
-
-        for payline_index, line in enumerate(PAYLINES):
-            symbols = []
-            coords = []
-            for reel_idx, row_idx in enumerate(line):
-                sym = grid[row_idx][reel_idx]
-                symbols.append(sym)
-                coords.append((row_idx, reel_idx))
-
-            first = symbols[0]
-            if first == SCATTER_SYMBOL:
+        total_cents = 0
+
+        fs_multiplier = 2 if using_free_spin else 1
+        # Everything but the paytable multiplier is the same for every line;
+        # scaled by 100 * 100 for the hundredths in the RTP and paytable
+        line_mult = bet * CENTS * self._rtp_pct * fs_multiplier
+
+        # Loop-invariant lookups as locals
+        pay_mult = _PAY_MULT_X100
+        symbols = SYMBOLS
+        coords = _PAYLINE_COORDS
+        scatter_id = _SCATTER_ID
+
+        for payline_index, i0, i1, i2, i3, i4 in _PAYLINE_SCAN:
+            first = flat[i0]
+            if first == scatter_id:
                 continue
-            run_len = 1
-            for i in range(1, self.reels):
-                if symbols[i] == first:
-                    run_len += 1
-                else:
-                    break
-
-            if run_len >= 3 and first in PAYTABLE:
-                base_mult = PAYTABLE[first].get(run_len, 0.0)
-                line_win = bet * base_mult * self.rtp_multiplier * fs_multiplier
-                if line_win > 0:
-                    total += line_win
-                    path = coords[:run_len]
+            # Fewer than 3 in a row never pays
+            if flat[i1] != first or flat[i2] != first:
+                continue
+            run_len = 3
+            if flat[i3] == first:
+                run_len = 4
+                if flat[i4] == first:
+                    run_len = 5
+
+            base_mult = pay_mult[first][run_len]
+            if base_mult:
+                line_win_cents = (line_mult * base_mult + 5_000) // 10_000
+                if line_win_cents > 0:
+                    total_cents += line_win_cents
+                    path = list(coords[payline_index][:run_len])
                     win_details.append({
                         "type": "adjacent_path",
-                        "character": first,
+                        "character": symbols[first],
                         "count": run_len,
                         "path": path,
                         "payline_index": payline_index,
-                        "win": round(line_win, 2),
+                        "win": line_win_cents / CENTS,
                     })
 
-        return win_details, round(total, 2)
+        return win_details, total_cents
 
     # ------------- Scatter / free spins -------------
 
-    def _evaluate_scatters(self, grid):
+    def _evaluate_scatters(self, flat):
         """
-        Count scatter symbols anywhere; award free spins on 3+.
+        Count scatter symbols anywhere on the row-major `flat` grid of
+        symbol IDs; award free spins on 3+.
+        Positions are only collected when a feature is awarded.
         """
+        count = flat.count(_SCATTER_ID)
         scatter_positions = []
-        for r in range(self.rows):
-            for c in range(self.reels):
-                if grid[r][c] == SCATTER_SYMBOL:
-                    scatter_positions.append((r, c))
-
-        count = len(scatter_positions)
         free_spins_awarded = False
 
         if count >= 3:
-            if count == 3:
-                award = 10
-            elif count == 4:
-                award = 12
-            else:
-                award = 15
-            self.free_spins += award
+            scatter_positions = [divmod(i, REELS) for i, sym in enumerate(flat) if sym == _SCATTER_ID]
+            self.free_spins += SCATTER_AWARDS[min(count, 5)]
             free_spins_awarded = True
 
         return scatter_positions, free_spins_awarded
@@ -469,23 +709,321 @@ class HauntedHouseSlot:
     def _roll_jackpots(self, bet: int):
         """
         Randomly award jackpots. Probability scales with bet size.
+        Returns a list of (name, amount_cents) hits; hit pots reset to base.
         """
         wins = []
-        scale = max(0.1, min(5.0, bet / 10.0))
-        for name, data in self.jackpots.items():
-            p = self._jackpot_base_probs[name] * scale
-            p = min(p, 0.25)
-            if self.rng.random() < p:
-                amt = round(data["current"], 2)
-                wins.append({"name": name, "amount": amt})
-                data["current"] = data["base"]
+        thresholds = self._jackpot_thresholds.get(bet)
+        if thresholds is None:
+            thresholds = self._jackpot_thresholds[bet] = self._jackpot_thresholds_for(bet)
+        # Two draws split into four independent 32-bit slices, one per pot;
+        # even the grand at the smallest bet keeps a threshold of ~850
+        d0, d1 = self.rng.next_block(2)
+        draws = (d0 >> 32, d0 & _MASK32, d1 >> 32, d1 & _MASK32)
+        for (name, threshold), draw in zip(thresholds, draws):
+            if draw < threshold:
+                data = self.jackpots[name]
+                wins.append((name, data["current_cents"]))
+                data["current_cents"] = data["base_cents"]
         return wins
 
+    def _jackpot_thresholds_for(self, bet: int) -> tuple:
+        """Per-pot hit thresholds on a 32-bit draw; the chance scales with bet, capped at 25%."""
+        scale = max(0.1, min(5.0, bet / 10.0))
+        return tuple(
+            (name, int(min(p * scale, 0.25) * (1 << 32)))
+            for name, p in self._jackpot_base_probs.items()
+        )
+
+    # ------------- Batch simulation -------------
+
+    def simulate(self, n_spins: int, bet: int = 1, chunks: int = 64) -> dict:
+        """
+        Run `n_spins` spins through a compiled, parallel kernel for RTP tuning.
+
+        Spins are split into `chunks` runs, each on its own jumped RNG
+        stream; within a run, scatters award free spins (paid at 2x, no
+        bet charged) exactly like spin(). Free spins still owed when a run
+        ends are dropped, and progressive jackpots are left out, so the
+        result is the line + free spins RTP. Balance and jackpots are not
+        touched. Requires numba.
+        """
+        if not _HAS_NUMBA:
+            raise RuntimeError("simulate() needs numba and numpy installed")
+        if n_spins <= 0 or chunks <= 0:
+            raise ValueError("n_spins and chunks must be positive")
+
+        states = np.empty((chunks, 4), dtype=np.uint64)
+        for c in range(chunks):
+            self.rng.jump()
+            states[c] = (self.rng.s0, self.rng.s1, self.rng.s2, self.rng.s3)
+        self.rng.jump()  # keep live play off the last simulated stream
+
+        wins, free, triggers = _simulate_kernel(
+            states, n_spins,
+            np.frombuffer(self._strip_ids, dtype=np.uint8),
+            _PAYLINE_ARR,
+            _PAY_MULT_ARR,
+            _SCATTER_ID,
+            _SCATTER_AWARDS_ARR,
+            bet * CENTS * self._rtp_pct,
+        )
+
+        paid_spins = n_spins - int(np.count_nonzero(free))
+        total_bet_cents = paid_spins * bet * CENTS
+        total_win_cents = int(wins.sum())
+        return {
+            "spins": n_spins,
+            "paid_spins": paid_spins,
+            "total_bet_cents": total_bet_cents,
+            "total_win_cents": total_win_cents,
+            "rtp": total_win_cents / total_bet_cents if total_bet_cents else 0.0,
+            "hit_rate": int(np.count_nonzero(wins)) / n_spins,
+            "free_spin_triggers": int(np.count_nonzero(triggers)),
+            "wins_cents": wins,
+        }
+
+
+if _HAS_NUMBA:
+    from numba import prange
+
+    _M32 = np.uint64(0xFFFFFFFF)
+
+    # Lookup tables for the kernel, built once: flat grid indices per payline,
+    # pay multiplier by [symbol ID, run length] (scatter row all zero), and
+    # free spins by scatter count
+    _PAYLINE_ARR = np.array(_PAYLINE_FLAT, dtype=np.int64)
+    _PAY_MULT_ARR = np.array(_PAY_MULT_X100, dtype=np.int64)
+    _SCATTER_AWARDS_ARR = np.array([SCATTER_AWARDS.get(k, 0) for k in range(REELS + 1)], dtype=np.int64)
+
+    @njit(cache=True)
+    def _xoshiro_next(s):
+        """One xoshiro256** step on the length-4 uint64 state `s`."""
+        result = _rotl64(s[1] * np.uint64(5), 7) * np.uint64(9)
+        t = s[1] << np.uint64(17)
+        s[2] ^= s[0]
+        s[3] ^= s[1]
+        s[1] ^= s[2]
+        s[0] ^= s[3]
+        s[2] ^= t
+        s[3] = _rotl64(s[3], 45)
+        return result
+
+    @njit(cache=True)
+    def _bounded_next(s, n):
+        """
+        Lemire reduction of the next draw to [0, n), as Xoshiro256StarStar.bounded.
+        n is below 2**32, so the 128-bit product is built from 32-bit halves.
+        """
+        while True:
+            x = _xoshiro_next(s)
+            a = (x & _M32) * n
+            b = (x >> np.uint64(32)) * n + (a >> np.uint64(32))
+            low = (b << np.uint64(32)) | (a & _M32)
+            if low >= n or low >= (np.uint64(0) - n) % n:
+                return b >> np.uint64(32)
+
+    @njit(parallel=True, cache=True)
+    def _simulate_kernel(states, n_spins, strip, paylines, pay_mult, scatter_id, awards, line_mult):
+        """
+        Returns per-spin (win_cents, was_free_spin, triggered_free_spins).
+        Mirrors _generate_grid, _evaluate_lines and _evaluate_scatters.
+        """
+        n_chunks = states.shape[0]
+        wins = np.zeros(n_spins, dtype=np.int64)
+        free = np.zeros(n_spins, dtype=np.bool_)
+        triggers = np.zeros(n_spins, dtype=np.bool_)
+        n = strip.shape[0]
+        n64 = np.uint64(n)
+        per_chunk = (n_spins + n_chunks - 1) // n_chunks
+        for c in prange(n_chunks):
+            s = states[c]
+            flat = np.empty(ROWS * REELS, dtype=np.uint8)
+            free_left = 0
+            for i in range(c * per_chunk, min(n_spins, (c + 1) * per_chunk)):
+                using_free_spin = free_left > 0
+                for reel in range(REELS):
+                    stop = np.int64(_bounded_next(s, n64))
+                    flat[reel] = strip[stop - 1 if stop > 0 else n - 1]
+                    flat[REELS + reel] = strip[stop]
+                    flat[2 * REELS + reel] = strip[stop + 1 if stop + 1 < n else 0]
+
+                mult = line_mult * 2 if using_free_spin else line_mult
+                total = 0
+                for k in range(paylines.shape[0]):
+                    first = flat[paylines[k, 0]]
+                    if first == scatter_id:
+                        continue
+                    if flat[paylines[k, 1]] != first or flat[paylines[k, 2]] != first:
+                        continue
+                    run_len = 3
+                    if flat[paylines[k, 3]] == first:
+                        run_len = 4
+                        if flat[paylines[k, 4]] == first:
+                            run_len = 5
+                    total += (mult * pay_mult[first, run_len] + 5_000) // 10_000
+                wins[i] = total
+
+                count = 0
+                for j in range(ROWS * REELS):
+                    if flat[j] == scatter_id:
+                        count += 1
+                if count >= 3:
+                    free_left += awards[min(count, 5)]
+                    triggers[i] = True
+                if using_free_spin:
+                    free_left -= 1
+                    free[i] = True
+        return wins, free, triggers
+
+
+# ---------------------------------------------------------------------------
+# Background image decoding
+# ---------------------------------------------------------------------------
+
+class _SymbolDecodeSignals(QObject):
+    # (symbol, scaled QImage; null if the file is missing or unreadable)
+    image_ready = pyqtSignal(object, object)
+
+
+class SymbolDecodeTask(QRunnable):
+    """Load one symbol PNG and scale it to `size` x `size` on a pool thread."""
+
+    def __init__(self, symbol: str, size: int):
+        super().__init__()
+        self.symbol = symbol
+        self.size = size
+        self.signals = _SymbolDecodeSignals()
+
+    def run(self):
+        img = QImage(str(IMAGES_DIR / f"{self.symbol}.png"))
+        if not img.isNull():
+            img = img.scaled(
+                self.size, self.size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+        self.signals.image_ready.emit(self.symbol, img)
+
+
+class _GifDecodeSignals(QObject):
+    # (gif_path, list[QImage], first frame delay in ms)
+    frames_ready = pyqtSignal(object, object, int)
+
+
+class GifDecodeTask(QRunnable):
+    """
+    Decode every frame of a GIF, scaled to width x height, on a pool thread.
+
+    Frames are produced as QImage (QPixmap may only be created on the UI
+    thread) and handed back through `signals.frames_ready`, which Qt
+    delivers to the UI thread as a queued call.
+    """
+
+    def __init__(self, gif_path: Path, width: int, height: int):
+        super().__init__()
+        self.gif_path = gif_path
+        self.width = width
+        self.height = height
+        self.signals = _GifDecodeSignals()
+
+    def run(self):
+        reader = QImageReader(str(self.gif_path))
+        frames = []
+        delay = 0
+        while True:
+            img = reader.read()
+            if img.isNull():
+                break
+            if not frames:
+                delay = reader.nextImageDelay()
+            frames.append(img.scaled(
+                self.width, self.height,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            ))
+        self.signals.frames_ready.emit(self.gif_path, frames, delay if delay > 0 else 100)
+
 
 # ---------------------------------------------------------------------------
 # PyQt5 UI
 # ---------------------------------------------------------------------------
 
+# Style sheets, built once at import rather than on every style toggle
+
+_BG_IMAGE = IMAGES_DIR / "haunted_background.jpg"
+
+if _BG_IMAGE.exists():
+    _BASE_STYLE = f"""
+        QWidget {{
+            background-color: #05030a;
+            background-image: url("{_BG_IMAGE.as_posix()}");
+            background-position: center;
+            background-repeat: no-repeat;
+            background-attachment: fixed;
+            color: #ffffff;
+        }}
+    """
+else:
+    _BASE_STYLE = """
+        QWidget {
+            background-color: qlineargradient(
+                spread:pad,
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 #05030a, stop:1 #12001f
+            );
+            color: #ffffff;
+        }
+    """
+
+_FREE_SPINS_STYLE = """
+    QWidget {
+        background-color: qlineargradient(
+            spread:pad,
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #1b0033, stop:1 #35005d
+        );
+        color: #ffffff;
+    }
+"""
+
+# The reel grid container carries the style for all of its cells, so a
+# border change is one setStyleSheet call instead of one per cell
+_CELL_STYLE = """
+    QWidget#reelGrid {{
+        background: transparent;
+        border: none;
+    }}
+    QLabel#cell {{
+        border-radius: 12px;
+        border: {border};
+        background-color: qradialgradient(
+            cx:0.5, cy:0.5, radius:0.8,
+            fx:0.5, fy:0.5,
+            stop:0 #111111, stop:1 #050509
+        );
+    }}
+"""
+_CELL_STYLE_BASE = _CELL_STYLE.format(border="2px solid #444")
+_CELL_STYLE_FREE_SPINS = _CELL_STYLE.format(border="2px solid #b66dff")
+_CELL_STYLE_PULSE = _CELL_STYLE.format(border="2px solid #ffdd55")
+
+
+class GridCellLabel(QLabel):
+    """Grid cell that pauses its win-line movie while hidden and resumes it when shown."""
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        movie = self.movie()
+        if movie is not None and movie.state() == QMovie.MovieState.Paused:
+            movie.setPaused(False)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        movie = self.movie()
+        if movie is not None:
+            movie.setPaused(True)
+
+
 class SlotMachineUI(QWidget):
     def __init__(self):
         super().__init__()
@@ -496,54 +1034,87 @@ class SlotMachineUI(QWidget):
         self.game = HauntedHouseSlot(volatility="MEDIUM", rtp_mode="STANDARD")
         self.sounds = SoundManager()
         self._setup_sounds()
-        self._grid_gif_movies = []
+        # gif path -> the one win movie this spin, shared by every cell showing it
+        self._win_movies = {}
+        # (row, col) -> movie currently shown there; _win_movies owns them
+        self._cell_movies = WeakValueDictionary()
+        # (symbol, "win"/"celebration") -> gif path, or None if it isn't on disk
+        self._anim_paths = {}
+        for sym in SYMBOLS:
+            for kind in ("win", "celebration"):
+                path = ANIMATIONS_DIR / f"{sym}_{kind}.gif"
+                self._anim_paths[(sym, kind)] = path if path.exists() else None
+        self._anim_misses_reported = set()
+
+        # Scatter animation: one decoded frame list drives every scatter cell
+        fs_gif = ANIMATIONS_DIR / "freespins.gif"
+        self._freespins_gif_path = fs_gif if fs_gif.exists() else None
+        if self._freespins_gif_path is None:
+            print(f"[MISS] Free spins animation not found: {fs_gif}")
+        self._fs_frames = None
+        self._fs_frame_delay = 100
+        self._fs_frame_idx = 0
+        self._fs_anim_labels = []
+        self._fs_anim_timer = None
+        self._fs_decode_task = None
+        self._fs_pending_cells = None
+        # Filled in as the background symbol decodes finish; until then the
+        # cells are left blank
+        self._pix_cache = {}
+        self._symbol_tasks = self._load_symbol_pixmaps()
+        self._no_pixmap = QPixmap()  # shared blank for symbols without an image
+        self._invalidate_rendered_grid()
 
         # Reel spin animation state
         self.is_spinning = False
-        self.spin_timer = None
+        self.spin_anim = None
         self.spin_tick_count = 0
         self.spin_total_ticks = 0
         self.target_result = None
+        self._reel_feeds = []
 
         # current grid state
-        from random import choice
-        self.current_grid = [[choice(SYMBOLS) for _ in range(self.game.reels)] for _ in range(self.game.rows)]
+        from random import choices
+        self.current_grid = [choices(SYMBOLS, k=self.game.reels) for _ in range(self.game.rows)]
 
         # Free spins visual mode
         self._was_in_free_spins = False
+        self._free_spins_mode_on = False  # free spins look is showing
         self.free_spin_pulse_timer = None
+        self._pulse_paused = False  # pulse timer was running when the window hid
 
         self.init_ui()
 
+    # --- Window visibility: nothing animates while minimized/hidden ---
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.free_spin_pulse_timer is not None and self.free_spin_pulse_timer.isActive():
+            self.free_spin_pulse_timer.stop()
+            self._pulse_paused = True
+        if self._fs_anim_timer is not None:
+            self._fs_anim_timer.stop()
+        if self.spin_anim is not None and self.spin_anim.state() == QAbstractAnimation.State.Running:
+            self.spin_anim.pause()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pulse_paused:
+            self._pulse_paused = False
+            if self._free_spins_mode_on:
+                self.free_spin_pulse_timer.start(300)
+        if self._fs_anim_labels and self._fs_anim_timer is not None:
+            self._fs_anim_timer.start(self._fs_frame_delay)
+        if self.spin_anim is not None and self.spin_anim.state() == QAbstractAnimation.State.Paused:
+            self.spin_anim.resume()
+
     # --- Base style with optional background image ---
 
     def _apply_base_style(self):
         """
         Apply base haunted casino style with optional background image.
         """
-        bg_path = IMAGES_DIR / "haunted_background.jpg"
-        if bg_path.exists():
-            self.setStyleSheet(f"""
-                QWidget {{
-                    background-color: #05030a;
-                    background-image: url("{bg_path.as_posix()}");
-                    background-position: center;
-                    background-repeat: no-repeat;
-                    background-attachment: fixed;
-                    color: #ffffff;
-                }}
-            """)
-        else:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: qlineargradient(
-                        spread:pad,
-                        x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #05030a, stop:1 #12001f
-                    );
-                    color: #ffffff;
-                }
-            """)
+        self.setStyleSheet(_BASE_STYLE)
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -675,30 +1246,27 @@ class SlotMachineUI(QWidget):
             }
         """)
         self.fs_overlay.setVisible(False)
+        self._fs_overlay_last_text = ""
+        self._fs_overlay_last_visible = False
         cabinet_layout.addWidget(self.fs_overlay)
 
-        # Reels grid
-        self.grid_layout = QGridLayout()
+        # Reels grid, in its own container so cell updates can be batched
+        self.grid_container = QWidget()
+        self.grid_container.setObjectName("reelGrid")
+        self._cell_style = None
+        self._set_cell_style(_CELL_STYLE_BASE)
+        self.grid_layout = QGridLayout(self.grid_container)
+        self.grid_layout.setContentsMargins(0, 0, 0, 0)
         self.grid_layout.setSpacing(6)
-        self.grid_labels = [[QLabel() for _ in range(self.game.reels)] for _ in range(self.game.rows)]
+        self.grid_labels = [[GridCellLabel() for _ in range(self.game.reels)] for _ in range(self.game.rows)]
         for r in range(self.game.rows):
             for c in range(self.game.reels):
                 lbl = self.grid_labels[r][c]
                 lbl.setFixedSize(150, 150)
-                lbl.setStyleSheet("""
-                    QLabel {
-                        border-radius: 12px;
-                        border: 2px solid #444;
-                        background-color: qradialgradient(
-                            cx:0.5, cy:0.5, radius:0.8,
-                            fx:0.5, fy:0.5,
-                            stop:0 #111111, stop:1 #050509
-                        );
-                    }
-                """)
+                lbl.setObjectName("cell")
                 lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 self.grid_layout.addWidget(lbl, r, c)
-        cabinet_layout.addLayout(self.grid_layout)
+        cabinet_layout.addWidget(self.grid_container)
 
         main_layout.addWidget(cabinet)
 
@@ -814,6 +1382,9 @@ class SlotMachineUI(QWidget):
                 color: #ffd700;
             }
         """)
+        self._free_spins_label_text = ""
+        self._label_texts = {}
+        self._jackpot_cents_shown = {}
         main_layout.addWidget(self.free_spins_label)
 
         self.setLayout(main_layout)
@@ -829,12 +1400,48 @@ class SlotMachineUI(QWidget):
         self.sounds.load("win", "win.wav", volume=0.7)
         self.sounds.load("freespin_award", "freespin_award.wav", volume=0.8)
         self.sounds.load("jackpot", "jackpot_win.wav", volume=0.9)
+        self.sounds.preload(["freespin_award"])
+
+    def _load_symbol_pixmaps(self) -> dict:
+        """
+        Start decoding and pre-scaling every symbol PNG on the thread pool.
+        Returns the pending tasks by symbol; results land in _on_symbol_image.
+        """
+        pool = QThreadPool.globalInstance()
+        tasks = {}
+        for sym in SYMBOLS:
+            task = SymbolDecodeTask(sym, 140)
+            task.signals.image_ready.connect(self._on_symbol_image)
+            tasks[sym] = task
+            pool.start(task)
+        return tasks
+
+    def _on_symbol_image(self, sym, img):
+        self._symbol_tasks.pop(sym, None)
+        if img.isNull():
+            print(f"[MISS] Image not found: {IMAGES_DIR / f'{sym}.png'}")
+        else:
+            self._pix_cache[sym] = QPixmap.fromImage(img)
+        if not self._symbol_tasks:
+            # Every symbol is in: redraw the cells that were showing names
+            self._invalidate_rendered_grid()
+            self._render_columns(range(self.game.reels))
 
     def _refresh_jackpots(self):
+        """Show the current pots, only touching labels whose amount changed."""
+        shown = self._jackpot_cents_shown
         for name, data in self.game.jackpots.items():
             lbl = self.jackpot_labels.get(name)
-            if lbl:
-                lbl.setText(f"${data['current']:.2f}")
+            cents = data["current_cents"]
+            if lbl and shown.get(name) != cents:
+                lbl.setText(f"${format_cents(cents)}")
+                shown[name] = cents
+
+    def _set_label_text(self, lbl, text: str):
+        """setText only when `text` differs from what `lbl` last showed."""
+        if self._label_texts.get(lbl) != text:
+            lbl.setText(text)
+            self._label_texts[lbl] = text
 
     # --- Free spins visual helpers ---
 
@@ -842,112 +1449,201 @@ class SlotMachineUI(QWidget):
         if self.free_spin_pulse_timer is None:
             self.free_spin_pulse_timer = QTimer(self)
             self.free_spin_pulse_timer.timeout.connect(self._pulse_free_spin_border)
+        self._free_spins_mode_on = True
         self._pulse_on = False
         self.free_spin_pulse_timer.start(300)
         self._apply_free_spin_style(True)
 
     def _exit_free_spins_mode(self):
+        self._free_spins_mode_on = False
         if self.free_spin_pulse_timer:
             self.free_spin_pulse_timer.stop()
         self._apply_free_spin_style(False)
-        self.fs_overlay.setVisible(False)
+        self._set_fs_overlay(False)
+
+    def _set_fs_overlay(self, visible: bool, text: Optional[str] = None):
+        """Update the free spins banner, touching the widget only on change."""
+        if text is not None and text != self._fs_overlay_last_text:
+            self.fs_overlay.setText(text)
+            self._fs_overlay_last_text = text
+        if visible != self._fs_overlay_last_visible:
+            self.fs_overlay.setVisible(visible)
+            self._fs_overlay_last_visible = visible
+
+    def _set_free_spins_label(self, text: str):
+        if text != self._free_spins_label_text:
+            self.free_spins_label.setText(text)
+            self._free_spins_label_text = text
 
     def _apply_free_spin_style(self, on: bool):
         if on:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: qlineargradient(
-                        spread:pad,
-                        x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #1b0033, stop:1 #35005d
-                    );
-                    color: #ffffff;
-                }
-            """)
-            border = "2px solid #b66dff"
-            self.fs_overlay.setText("🎃 FREE SPINS MODE 🎃")
-            self.fs_overlay.setVisible(True)
+            self.setStyleSheet(_FREE_SPINS_STYLE)
+            cell_style = _CELL_STYLE_FREE_SPINS
+            self._set_fs_overlay(True, "🎃 FREE SPINS MODE 🎃")
         else:
             self._apply_base_style()
-            border = "2px solid #444"
-            self.fs_overlay.setVisible(False)
-
-        for r in range(self.game.rows):
-            for c in range(self.game.reels):
-                self.grid_labels[r][c].setStyleSheet(f"""
-                    QLabel {{
-                        border-radius: 12px;
-                        border: {border};
-                        background-color: qradialgradient(
-                            cx:0.5, cy:0.5, radius:0.8,
-                            fx:0.5, fy:0.5,
-                            stop:0 #111111, stop:1 #050509
-                        );
-                    }}
-                """)
+            cell_style = _CELL_STYLE_BASE
+            self._set_fs_overlay(False)
+        self._set_cell_style(cell_style)
 
     def _pulse_free_spin_border(self):
+        if not self._free_spins_mode_on:
+            return  # mode is over; leave the borders alone
         self._pulse_on = not getattr(self, "_pulse_on", False)
-        border = "2px solid #ffdd55" if self._pulse_on else "2px solid #b66dff"
-        for r in range(self.game.rows):
-            for c in range(self.game.reels):
-                self.grid_labels[r][c].setStyleSheet(f"""
-                    QLabel {{
-                        border-radius: 12px;
-                        border: {border};
-                        background-color: qradialgradient(
-                            cx:0.5, cy:0.5, radius:0.8,
-                            fx:0.5, fy:0.5,
-                            stop:0 #111111, stop:1 #050509
-                        );
-                    }}
-                """)
+        self._set_cell_style(_CELL_STYLE_PULSE if self._pulse_on else _CELL_STYLE_FREE_SPINS)
+
+    def _set_cell_style(self, style: str):
+        """Restyle every grid cell through the container, only when the style changes."""
+        if style is not self._cell_style:
+            self.grid_container.setStyleSheet(style)
+            self._cell_style = style
 
     # --- Grid & animations ---
 
     def update_grid(self, grid):
-        self.current_grid = [row[:] for row in grid]
-        for r in range(self.game.rows):
-            for c in range(self.game.reels):
-                char = grid[r][c]
-                img_path = IMAGES_DIR / f"{char}.png"
-                lbl = self.grid_labels[r][c]
-                pixmap = QPixmap(str(img_path))
-                if not pixmap.isNull():
-                    lbl.setPixmap(
-                        pixmap.scaled(
-                            140, 140,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-                    )
-                    lbl.setText("")
-                else:
-                    lbl.setPixmap(QPixmap())
-                    lbl.setText(char)
-                    if not img_path.exists():
-                        print(f"[MISS] Image not found: {img_path}")
+        if grid is not self.current_grid:
+            self.current_grid = [row[:] for row in grid]
+        self._render_columns(range(self.game.reels))
+
+    def _render_columns(self, cols):
+        """Show current_grid in reels `cols`, touching only cells whose symbol changed."""
+        grid = self.current_grid
+        rendered = self._rendered_grid
+        # Batch the cell updates into a single repaint of the grid
+        container = self.grid_container
+        container.setUpdatesEnabled(False)
+        try:
+            for r in range(self.game.rows):
+                for c in cols:
+                    char = grid[r][c]
+                    if rendered[r][c] is char:
+                        continue
+                    rendered[r][c] = char
+                    lbl = self.grid_labels[r][c]
+                    pixmap = self._pix_cache.get(char)
+                    if pixmap is not None:
+                        lbl.setPixmap(pixmap)
+                        lbl.setText("")
+                    else:
+                        lbl.setPixmap(self._no_pixmap)
+                        # Blank while the image is still decoding; the name only if it failed
+                        lbl.setText("" if char in self._symbol_tasks else char)
+        finally:
+            container.setUpdatesEnabled(True)
+        container.update()
+
+    def _invalidate_rendered_grid(self):
+        """Forget what the cells show so the next update_grid redraws all of them."""
+        self._rendered_grid = [[None] * self.game.reels for _ in range(self.game.rows)]
+
+    def _load_movie(self, gif_path: Path) -> QMovie:
+        """
+        Create a QMovie for `gif_path`.
+
+        CacheAll keeps the decoded frames for the movie's lifetime, so each
+        GIF is decoded once per spin however many cells share the movie.
+        """
+        movie = QMovie(str(gif_path))
+        movie.setCacheMode(QMovie.CacheMode.CacheAll)
+        return movie
+
+    def _start_scatter_animation(self, gif_path: Path, cells):
+        """
+        Show the scatter GIF on `cells`, all driven by one shared timer.
+
+        The first time, the frames are decoded on a pool thread; the cells
+        keep showing the static scatter symbol until they arrive.
+        """
+        if self._fs_frames is None:
+            self._fs_pending_cells = cells
+            if self._fs_decode_task is None:
+                size = self.grid_labels[0][0].size()
+                self._fs_decode_task = GifDecodeTask(gif_path, size.width(), size.height())
+                self._fs_decode_task.signals.frames_ready.connect(self._on_frames_ready)
+                QThreadPool.globalInstance().start(self._fs_decode_task)
+            return
+        if not self._fs_frames:
+            return
+        labels = [self.grid_labels[row][col] for row, col in cells]
+        self._fs_anim_labels = labels
+        self._fs_frame_idx = 0
+        self._set_cell_pixmaps(labels, self._fs_frames[0])
+        if self._fs_anim_timer is None:
+            self._fs_anim_timer = QTimer(self)
+            self._fs_anim_timer.timeout.connect(self._advance_scatter_frame)
+        self._fs_anim_timer.start(self._fs_frame_delay)
+
+    def _on_frames_ready(self, gif_path, images, delay):
+        self._fs_decode_task = None
+        self._fs_frames = [QPixmap.fromImage(img) for img in images]
+        self._fs_frame_delay = delay
+        cells, self._fs_pending_cells = self._fs_pending_cells, None
+        if cells and not self.is_spinning:
+            self._start_scatter_animation(gif_path, cells)
+
+    def _advance_scatter_frame(self):
+        if self.grid_container.visibleRegion().isEmpty():
+            return  # grid is off screen; don't spend repaints on it
+        self._fs_frame_idx = (self._fs_frame_idx + 1) % len(self._fs_frames)
+        self._set_cell_pixmaps(self._fs_anim_labels, self._fs_frames[self._fs_frame_idx])
+
+    def _set_cell_pixmaps(self, labels, pixmap):
+        """Set `pixmap` on several grid cells with a single repaint of the grid."""
+        container = self.grid_container
+        container.setUpdatesEnabled(False)
+        try:
+            for lbl in labels:
+                lbl.setPixmap(pixmap)
+        finally:
+            container.setUpdatesEnabled(True)
+        container.update()
+
+    def _stop_scatter_animation(self):
+        if self._fs_anim_timer is not None:
+            self._fs_anim_timer.stop()
+        self._fs_anim_labels = []
+        self._fs_pending_cells = None
+
+    def _release_grid_movies(self):
+        """Stop and free the win movies from the previous spin."""
+        for row, col in list(self._cell_movies.keys()):
+            self.grid_labels[row][col].clear()
+        self._cell_movies.clear()
+        for movie in self._win_movies.values():
+            movie.stop()
+            movie.deleteLater()
+        self._win_movies.clear()
 
     def show_grid_animation(self, win, grid):
         character = win["character"].lower()
         win_amt = win["win"]
         anim_type = "celebration" if win_amt < 5 else "win"
-        gif_path = ANIMATIONS_DIR / f"{character}_{anim_type}.gif"
-        if not gif_path.exists():
-            print(f"[MISS] Animation not found: {gif_path}")
+        key = (character, anim_type)
+        gif_path = self._anim_paths.get(key)
+        if gif_path is None:
+            # Say so once per file, not on every winning line that wants it
+            if key not in self._anim_misses_reported:
+                self._anim_misses_reported.add(key)
+                print(f"[MISS] Animation not found: {ANIMATIONS_DIR / f'{character}_{anim_type}.gif'}")
             return
 
         cells = win.get("path", [])
+        if not cells:
+            return
+        # One decoder per GIF: every cell showing it shares the same movie
+        movie = self._win_movies.get(gif_path)
+        if movie is None:
+            movie = self._load_movie(gif_path)
+            movie.setScaledSize(self.grid_labels[0][0].size())
+            self._win_movies[gif_path] = movie
+            movie.start()
+            if self.grid_container.visibleRegion().isEmpty():
+                movie.setPaused(True)
         for (row, col) in cells:
             lbl = self.grid_labels[row][col]
             lbl.clear()
-            movie = QMovie(str(gif_path))
-            movie.setScaledSize(lbl.size())
             lbl.setMovie(movie)
-            movie.start()
-            lbl._movie_refs = getattr(lbl, '_movie_refs', [])
-            lbl._movie_refs.append(movie)
-            self._grid_gif_movies.append(movie)
+            self._cell_movies[(row, col)] = movie
 
     # --- Spin button handlers ---
 
@@ -955,11 +1651,9 @@ class SlotMachineUI(QWidget):
         if self.is_spinning:
             return
 
-        for lbl_row in self.grid_labels:
-            for lbl in lbl_row:
-                if hasattr(lbl, '_movie_refs'):
-                    lbl.clear()
-        self._grid_gif_movies.clear()
+        self._stop_scatter_animation()
+        self._release_grid_movies()
+        self._invalidate_rendered_grid()
 
         bet = self.bet_combo.currentData()
         result = self.game.spin(bet)
@@ -971,34 +1665,79 @@ class SlotMachineUI(QWidget):
         self.is_spinning = True
         self.spin_tick_count = 0
         self.spin_total_ticks = 8
-        interval_ms = 50
+        tick_ms = 50
+        self._reel_feeds = self._build_reel_feeds(result["grid"])
+        self.spin_total_ticks = max(len(feed) for feed in self._reel_feeds)
 
         self.spin_btn.setEnabled(False)
         self.win_details_label.setText("Spinning...")
 
         if self.current_grid is None:
-            from random import choice
-            self.current_grid = [[choice(SYMBOLS) for _ in range(self.game.reels)] for _ in range(self.game.rows)]
+            from random import choices
+            self.current_grid = [choices(SYMBOLS, k=self.game.reels) for _ in range(self.game.rows)]
 
         self.sounds.play("credit")
         self.sounds.start_loop("chains")
         self.sounds.start_loop("spin")
 
-        self.spin_timer = QTimer(self)
-        self.spin_timer.timeout.connect(self._advance_reels)
-        self.spin_timer.start(interval_ms)
+        # One animation drives the whole spin: its value is the number of reel
+        # ticks due so far, so late frames catch up instead of queueing
+        if self.spin_anim is None:
+            self.spin_anim = QVariantAnimation(self)
+            self.spin_anim.setStartValue(0)
+            self.spin_anim.valueChanged.connect(self._advance_reels)
+        self.spin_anim.setEndValue(self.spin_total_ticks)
+        self.spin_anim.setDuration(self.spin_total_ticks * tick_ms)
+        self.spin_anim.start()
+
+    def _build_reel_feeds(self, final_grid):
+        """
+        Precompute, per reel, the symbol that enters the top row on each tick.
 
-    def _advance_reels(self):
-        from random import choice
-        for c in range(self.game.reels):
-            for r in range(self.game.rows - 1, 0, -1):
-                self.current_grid[r][c] = self.current_grid[r - 1][c]
-            self.current_grid[0][c] = choice(SYMBOLS)
-        self.update_grid(self.current_grid)
-        self.spin_tick_count += 1
+        Reels stop left to right, one tick apart, the last one on the final
+        tick. Each feed ends with that reel's result column (bottom symbol
+        first), so the reel comes to rest exactly on the result.
+        """
+        from random import choices
+        rows, reels = self.game.rows, self.game.reels
+        fill_counts = [max(rows, self.spin_total_ticks - (reels - 1 - c)) - rows for c in range(reels)]
+        # Every filler symbol for the spin in one draw, sliced per reel
+        fillers = choices(SYMBOLS, k=sum(fill_counts))
+        feeds = []
+        start = 0
+        for c, count in enumerate(fill_counts):
+            landing = [final_grid[r][c] for r in range(rows - 1, -1, -1)]
+            feeds.append(fillers[start:start + count] + landing)
+            start += count
+        return feeds
+
+    def _advance_reels(self, ticks_due):
+        """Run every reel tick up to `ticks_due`, then redraw once."""
+        if not self.is_spinning:
+            return
+        ticks_due = min(int(ticks_due), self.spin_total_ticks)
+        moving = set()
+        # Grid dimensions are fixed for the spin; bind them once, not per cell
+        grid = self.current_grid
+        top = grid[0]
+        row_pairs = [(grid[r], grid[r - 1]) for r in range(self.game.rows - 1, 0, -1)]
+        feeds = list(enumerate(self._reel_feeds))
+        tick = self.spin_tick_count
+        while tick < ticks_due:
+            for c, feed in feeds:
+                if tick >= len(feed):
+                    continue  # this reel has already stopped
+                for row, above in row_pairs:
+                    row[c] = above[c]
+                top[c] = feed[tick]
+                moving.add(c)
+            tick += 1
+        self.spin_tick_count = tick
+        # The grid was shifted in place; only the moving reels need redrawing
+        if moving:
+            self._render_columns(sorted(moving))
         if self.spin_tick_count >= self.spin_total_ticks:
-            if self.spin_timer:
-                self.spin_timer.stop()
+            self.spin_anim.stop()
             self._finish_spin()
 
     def _finish_spin(self):
@@ -1021,14 +1760,11 @@ class SlotMachineUI(QWidget):
     # --- Display results ---
 
     def _display_result(self, result):
-        self.balance_label.setText(f"Balance: ${self.game.balance:.2f}")
-        self.total_win_label.setText(f"Last Win: ${result['win']:.2f}")
-
-        jps = result.get("jackpots", {})
-        for name, lbl in self.jackpot_labels.items():
-            if name in jps:
-                lbl.setText(f"${jps[name]:.2f}")
+        self._set_label_text(self.balance_label, f"Balance: ${format_cents(self.game.balance_cents)}")
+        self._set_label_text(self.total_win_label, f"Last Win: ${result['win']:.2f}")
+        self._refresh_jackpots()
 
+        # Build the whole details text first so the label parses it once
         if result["win_details"]:
             details_lines = []
             for win in result["win_details"]:
@@ -1038,14 +1774,14 @@ class SlotMachineUI(QWidget):
                     f"<b>${win['win']:.2f}</b>"
                 )
                 self.show_grid_animation(win, result["grid"])
-            self.win_details_label.setText("<br>".join(details_lines))
         else:
-            self.win_details_label.setText("No win this spin.")
+            details_lines = ["No win this spin."]
 
         if result.get("jackpot_wins"):
             jp_msgs = [f"{w['name'].capitalize()} Jackpot +${w['amount']:.2f}!" for w in result["jackpot_wins"]]
-            self.win_details_label.setText(self.win_details_label.text() + "<br>" + " ".join(jp_msgs))
+            details_lines.append(" ".join(jp_msgs))
             self.sounds.play("jackpot")
+        self.win_details_label.setText("<br>".join(details_lines))
 
         if result['win'] > 0:
             self.sounds.play("win")
@@ -1055,25 +1791,12 @@ class SlotMachineUI(QWidget):
             if result.get("free_spins_awarded"):
                 fs_text += " (+ spins awarded!)"
                 self.sounds.play("freespin_award")
-            self.free_spins_label.setText(fs_text)
+            self._set_free_spins_label(fs_text)
         else:
-            self.free_spins_label.setText("")
-
-        if result.get("freespins_cells"):
-            gif_path = ANIMATIONS_DIR / "freespins.gif"
-            if gif_path.exists():
-                for row, col in result["freespins_cells"]:
-                    lbl = self.grid_labels[row][col]
-                    lbl.clear()
-                    movie = QMovie(str(gif_path))
-                    movie.setScaledSize(lbl.size())
-                    lbl.setMovie(movie)
-                    movie.start()
-                    lbl._movie_refs = getattr(lbl, '_movie_refs', [])
-                    lbl._movie_refs.append(movie)
-                    self._grid_gif_movies.append(movie)
-            else:
-                print(f"[MISS] Free spins animation not found: {gif_path}")
+            self._set_free_spins_label("")
+
+        if result.get("freespins_cells") and self._freespins_gif_path is not None:
+            self._start_scatter_animation(self._freespins_gif_path, result["freespins_cells"])
 
         in_fs = bool(result.get("in_free_spins")) or (result.get("free_spins", 0) > 0)
         if in_fs and not self._was_in_free_spins:
@@ -1081,15 +1804,16 @@ class SlotMachineUI(QWidget):
         self._was_in_free_spins = in_fs
 
         if in_fs:
-            total = result.get("free_spins_session_total", 0.0)
+            total_cents = result.get("free_spins_session_total_cents", 0)
             if result.get("free_spins_just_ended"):
-                total = result.get("free_spins_session_final", total)
-            self.fs_overlay.setText(f"🎃 FREE SPINS MODE 🎃\nTotal: ${total:.2f}")
-            self.fs_overlay.setVisible(True)
+                total_cents = result.get("free_spins_session_final_cents", total_cents)
+            self._set_fs_overlay(True, f"🎃 FREE SPINS MODE 🎃\nTotal: ${format_cents(total_cents)}")
 
         if result.get("free_spins_just_ended"):
-            final_total = result.get("free_spins_session_final", 0.0)
-            QMessageBox.information(self, "Free Spins Complete", f"You won ${final_total:.2f} in free spins!")
+            final_cents = result.get("free_spins_session_final_cents", 0)
+            QMessageBox.information(
+                self, "Free Spins Complete", f"You won ${format_cents(final_cents)} in free spins!"
+            )
             self._exit_free_spins_mode()
 
 